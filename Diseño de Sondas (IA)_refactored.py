@@ -21,28 +21,54 @@ Versión: 2.1
 """
 
 import pandas as pd
+import numpy as np
 import math
+import os
+import string
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import logging
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
+from itertools import repeat
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import traceback
 
-# Configuración de logging más detallada
+try:
+    from numba import njit, prange, set_num_threads
+    NUMBA_DISPONIBLE = True
+except ImportError:  # numba es opcional: sin él se usa la ruta NumPy
+    NUMBA_DISPONIBLE = False
+
+try:
+    import xlsxwriter
+    XLSXWRITER_DISPONIBLE = True
+except ImportError:  # xlsxwriter es opcional: sin él se usa el motor Excel por defecto de pandas
+    XLSXWRITER_DISPONIBLE = False
+
+# Logging detallado (nivel DEBUG + archivo cienbio_debug.log) solo con CIENBIO_DEBUG=1;
+# por defecto solo advertencias y errores por consola, sin escritura a disco
+MODO_DEBUG = os.environ.get('CIENBIO_DEBUG', '') not in ('', '0')
+ARCHIVO_LOG = 'cienbio_debug.log'
+
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.DEBUG if MODO_DEBUG else logging.WARNING,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('cienbio_debug.log')
+        *([logging.FileHandler(ARCHIVO_LOG)] if MODO_DEBUG else [])
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Tabla de limpieza de secuencias: mayúsculas y eliminación de espacios en una sola pasada
+_CLEAN_TABLE = str.maketrans(string.ascii_lowercase, string.ascii_uppercase, ' \n\t\r')
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SondaResult:
     """Clase para almacenar resultados de evaluación de sondas"""
     id_seq: str
@@ -78,6 +104,14 @@ class CalculadorTermodinamico:
         'GG': (-8.0, -19.9), 'CC': (-8.0, -19.9)
     }
     
+    # Código ASCII -> índice de base; cualquier otro carácter se marca con 255
+    _BASE_LUT = np.full(256, 255, dtype=np.uint8)
+    _BASE_LUT[np.frombuffer(b'ACGT', dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+    
+    # Temperaturas fijas de ΔG en Kelvin
+    _T25_K = 25.0 + 273.15
+    _T37_K = 37.0 + 273.15
+    
     def __init__(self, primer_conc: float = 500e-9, salt_conc: float = 50e-3):
         """
         Inicializa el calculador termodinámico
@@ -89,6 +123,11 @@ class CalculadorTermodinamico:
         self.primer_conc = primer_conc
         self.salt_conc = salt_conc
         self.R = 1.987  # Constante de gases en cal/mol·K
+        
+        # Términos constantes de la ecuación de Tm, precalculados una sola vez
+        # (concentraciones no positivas se rechazan en _calcular_tm)
+        self._r_log_primer = self.R * math.log(primer_conc) if primer_conc > 0 else float('nan')
+        self._correccion_sal = 16.6 * math.log10(salt_conc) if salt_conc > 0 else float('nan')
         logger.debug(f"Calculadora inicializada: primer_conc={primer_conc}, salt_conc={salt_conc}")
     
     def calcular_propiedades_termodinamicas(self, secuencia: str) -> Dict[str, float]:
@@ -104,7 +143,6 @@ class CalculadorTermodinamico:
         try:
             secuencia_original = secuencia
             secuencia = self._limpiar_secuencia(secuencia)
-            logger.debug(f"Secuencia original: '{secuencia_original}' -> Limpia: '{secuencia}'")
             
             if not self._validar_secuencia(secuencia):
                 logger.error(f"Secuencia inválida: '{secuencia}' (original: '{secuencia_original}')")
@@ -116,8 +154,8 @@ class CalculadorTermodinamico:
                     'gc_content': float('nan')
                 }
             
-            dh_total, ds_total = self._calcular_parametros_nn(secuencia)
-            logger.debug(f"Parámetros NN: ΔH={dh_total}, ΔS={ds_total}")
+            enc = self._encode(secuencia)
+            dh_total, ds_total = self._calcular_parametros_nn(enc)
             
             # Correcciones de iniciación
             ds_total += -1.4  # Corrección entropía de iniciación
@@ -127,13 +165,14 @@ class CalculadorTermodinamico:
             tm = self._calcular_tm(dh_total, ds_total)
             
             # Cálculo de ΔG a diferentes temperaturas
-            dg_25 = self._calcular_dg(dh_total, ds_total, 25.0)  # 25°C (estándar)
-            dg_37 = self._calcular_dg(dh_total, ds_total, 37.0)  # 37°C (fisiológica)
+            dg_25 = self._calcular_dg_25(dh_total, ds_total)  # 25°C (estándar)
+            dg_37 = self._calcular_dg_37(dh_total, ds_total)  # 37°C (fisiológica)
             
             # Cálculo de contenido GC
-            gc_content = self._calcular_gc_content(secuencia)
+            gc_content = self._calcular_gc_content(enc)
             
-            logger.debug(f"Propiedades calculadas - Tm: {tm}°C, ΔH: {dh_total}, ΔG(25°C): {dg_25}, ΔG(37°C): {dg_37}, GC: {gc_content}%")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Propiedades calculadas para '{secuencia}' - Tm: {tm}°C, ΔH: {dh_total}, ΔG(25°C): {dg_25}, ΔG(37°C): {dg_37}, GC: {gc_content}%")
             
             return {
                 'tm': round(tm, 2),
@@ -153,11 +192,101 @@ class CalculadorTermodinamico:
                 'gc_content': float('nan')
             }
     
+    def _sumas_nn_lote(self, secuencias: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sumas NN (ΔH, ΔS) sin correcciones de iniciación y %GC de cada secuencia
+        
+        Usa el kernel compilado con Numba si está disponible y, si no, evalúa
+        cada grupo de secuencias de igual longitud como una matriz NumPy (n, L).
+        """
+        if NUMBA_DISPONIBLE:
+            longitudes = np.fromiter(map(len, secuencias), dtype=np.int64, count=len(secuencias))
+            matriz = np.full((len(secuencias), longitudes.max(initial=0)), 255, dtype=np.uint8)
+            for i, secuencia in enumerate(secuencias):
+                matriz[i, :longitudes[i]] = self._encode(secuencia)
+            return _sumas_nn_batch(matriz, longitudes, _DH_LUT, _DS_LUT)
+        
+        n = len(secuencias)
+        dh_nn = np.full(n, np.nan)
+        ds_nn = np.full(n, np.nan)
+        gc_content = np.full(n, np.nan)
+        
+        grupos: Dict[int, List[int]] = {}
+        for i, secuencia in enumerate(secuencias):
+            grupos.setdefault(len(secuencia), []).append(i)
+        
+        for longitud, filas in grupos.items():
+            if longitud < 2:
+                continue
+            
+            matriz = self._encode(''.join(secuencias[i] for i in filas)).reshape(len(filas), longitud)
+            self._sumas_nn_grupo(matriz, np.asarray(filas), dh_nn, ds_nn, gc_content)
+        
+        return dh_nn, ds_nn, gc_content
+    
+    def _sumas_nn_ventanas(self, enc: np.ndarray, inicios: np.ndarray,
+                           longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Igual que _sumas_nn_lote para las subsecuencias enc[inicio:inicio + longitud]
+        
+        Las sondas se toman directamente de la secuencia madre ya codificada con
+        _encode, sin limpiar, validar ni codificar de nuevo cada sonda.
+        """
+        columnas = np.arange(longitudes.max(initial=0))
+        posiciones = np.minimum(inicios[:, None] + columnas, enc.size - 1)
+        matriz = np.where(columnas < longitudes[:, None], enc[posiciones], np.uint8(255))
+        
+        if NUMBA_DISPONIBLE:
+            return _sumas_nn_batch(matriz, longitudes, _DH_LUT, _DS_LUT)
+        
+        n = len(inicios)
+        dh_nn = np.full(n, np.nan)
+        ds_nn = np.full(n, np.nan)
+        gc_content = np.full(n, np.nan)
+        
+        for longitud in np.unique(longitudes):
+            if longitud < 2:
+                continue
+            filas = np.flatnonzero(longitudes == longitud)
+            self._sumas_nn_grupo(matriz[filas, :longitud], filas, dh_nn, ds_nn, gc_content)
+        
+        return dh_nn, ds_nn, gc_content
+    
+    @staticmethod
+    def _sumas_nn_grupo(matriz: np.ndarray, filas: np.ndarray, dh_nn: np.ndarray,
+                        ds_nn: np.ndarray, gc_content: np.ndarray) -> None:
+        """Escribe en las filas indicadas las sumas NN y %GC de una matriz codificada (n, L) de igual longitud"""
+        validas = ~(matriz == 255).any(axis=1)
+        matriz = matriz[validas]
+        filas = filas[validas]
+        
+        idx = matriz[:, :-1].astype(np.intp) * 4 + matriz[:, 1:]
+        dh_nn[filas] = _DH_LUT[idx].sum(axis=1)
+        ds_nn[filas] = _DS_LUT[idx].sum(axis=1)
+        gc_content[filas] = ((matriz == 1) | (matriz == 2)).sum(axis=1) / matriz.shape[1] * 100.0
+    
+    def _propiedades_desde_sumas(self, dh_nn: np.ndarray, ds_nn: np.ndarray) -> Dict[str, np.ndarray]:
+        """Aplica correcciones de iniciación y calcula Tm y ΔG (redondeados) a partir de sumas NN"""
+        # Correcciones de iniciación
+        ds_total = ds_nn + -1.4
+        dh_total = dh_nn + 0.2
+        
+        tm = self._calcular_tm(dh_total, ds_total)
+        dg_25 = self._calcular_dg_25(dh_total, ds_total)
+        dg_37 = self._calcular_dg_37(dh_total, ds_total)
+        
+        return {
+            'tm': np.round(tm, 2),
+            'dh': np.round(dh_total, 2),
+            'dg_25': np.round(dg_25, 2),
+            'dg_37': np.round(dg_37, 2)
+        }
+    
     def _limpiar_secuencia(self, secuencia: str) -> str:
         """Limpia y normaliza la secuencia"""
         if pd.isna(secuencia):
             return ""
-        return str(secuencia).upper().replace(" ", "").replace("\n", "").replace("\t", "").replace("\r", "")
+        return str(secuencia).translate(_CLEAN_TABLE)
     
     def _validar_secuencia(self, secuencia: str) -> bool:
         """Valida que la secuencia contenga solo nucleótidos válidos"""
@@ -175,29 +304,35 @@ class CalculadorTermodinamico:
             
         return True
     
-    def _calcular_parametros_nn(self, secuencia: str) -> Tuple[float, float]:
-        """Calcula parámetros termodinámicos usando nearest neighbor"""
-        dh_total = 0.0
-        ds_total = 0.0
+    @classmethod
+    def _encode(cls, secuencia: str) -> np.ndarray:
+        """Codifica la secuencia como arreglo uint8 de índices de base (255 = base no válida)"""
+        return cls._BASE_LUT[np.frombuffer(secuencia.encode('ascii', 'replace'), dtype=np.uint8)]
+    
+    def _calcular_parametros_nn(self, enc: np.ndarray) -> Tuple[float, float]:
+        """Calcula parámetros termodinámicos usando nearest neighbor sobre la secuencia codificada"""
+        if enc.size < 2:
+            return 0.0, 0.0
         
-        for i in range(len(secuencia) - 1):
-            dinucleotido = secuencia[i:i+2]
-            delta_h, delta_s = self.NN_PARAMS.get(dinucleotido, (-7.0, -20.0))
-            dh_total += delta_h
-            ds_total += delta_s
-            logger.debug(f"Dinucleótido {dinucleotido}: ΔH={delta_h}, ΔS={delta_s}")
+        idx = enc[:-1].astype(np.intp) * 4 + enc[1:]
+        if (enc == 255).any():
+            # Dinucleótidos con bases no reconocidas usan el valor por defecto (-7.0, -20.0)
+            invalidos = (enc[:-1] == 255) | (enc[1:] == 255)
+            validos = idx[~invalidos]
+            n_invalidos = int(invalidos.sum())
+            return (float(_DH_LUT[validos].sum()) - 7.0 * n_invalidos,
+                    float(_DS_LUT[validos].sum()) - 20.0 * n_invalidos)
         
-        return dh_total, ds_total
+        return float(_DH_LUT[idx].sum()), float(_DS_LUT[idx].sum())
     
-    def _calcular_tm(self, dh: float, ds: float) -> float:
-        """Calcula temperatura de melting"""
+    def _calcular_tm(self, dh, ds):
+        """Calcula temperatura de melting (acepta escalares o arreglos NumPy)"""
         try:
             # Verificar valores válidos para evitar errores matemáticos
-            if ds == 0 or self.primer_conc <= 0 or self.salt_conc <= 0:
+            if np.any(ds == 0) or self.primer_conc <= 0 or self.salt_conc <= 0:
                 raise ValueError(f"Valores inválidos: ΔS={ds}, primer_conc={self.primer_conc}, salt_conc={self.salt_conc}")
             
-            tm = (1000 * dh) / (ds + (self.R * math.log(self.primer_conc))) - 273.15 + \
-                 16.6 * math.log10(self.salt_conc)
+            tm = (1000 * dh) / (ds + self._r_log_primer) - 273.15 + self._correccion_sal
             return tm
         except Exception as e:
             logger.error(f"Error calculando Tm: ΔH={dh}, ΔS={ds}, error={e}")
@@ -230,23 +365,30 @@ class CalculadorTermodinamico:
             logger.error(f"Error calculando ΔG: ΔH={dh}, ΔS={ds}, T={temperatura_celsius}°C, error={e}")
             raise
     
-    def _calcular_gc_content(self, secuencia: str) -> float:
+    def _calcular_dg_25(self, dh, ds):
+        """ΔG en kcal/mol a 25°C (estándar); equivale a _calcular_dg(dh, ds, 25.0)"""
+        return dh - (self._T25_K * (ds / 1000.0))
+    
+    def _calcular_dg_37(self, dh, ds):
+        """ΔG en kcal/mol a 37°C (fisiológica); equivale a _calcular_dg(dh, ds, 37.0)"""
+        return dh - (self._T37_K * (ds / 1000.0))
+    
+    def _calcular_gc_content(self, enc: np.ndarray) -> float:
         """
         Calcula el contenido de GC de la secuencia
         
         Args:
-            secuencia: Secuencia de nucleótidos
+            enc: Secuencia codificada con _encode (C=1, G=2)
             
         Returns:
             Porcentaje de contenido GC
         """
-        if not secuencia:
+        if not enc.size:
             return 0.0
         
-        gc_count = secuencia.count('G') + secuencia.count('C')
-        total_bases = len(secuencia)
+        gc_count = int(np.count_nonzero((enc == 1) | (enc == 2)))
         
-        return (gc_count / total_bases) * 100.0
+        return (gc_count / enc.size) * 100.0
     
     def calcular_tm_y_dh(self, secuencia: str) -> Tuple[float, float]:
         """
@@ -262,6 +404,63 @@ class CalculadorTermodinamico:
         return props['tm'], props['dh']
 
 
+# Parámetros NN como tablas contiguas indexadas por base1*4 + base2 (A=0, C=1, G=2, T=3),
+# en orden canónico AA, AC, AG, AT, CA, ..., TT
+_DH_LUT, _DS_LUT = (
+    np.array(valores, dtype=np.float64)
+    for valores in zip(*(CalculadorTermodinamico.NN_PARAMS[b1 + b2] for b1 in 'ACGT' for b2 in 'ACGT'))
+)
+
+
+if NUMBA_DISPONIBLE:
+    @njit(cache=True, parallel=True)
+    def _sumas_nn_batch(enc_matrix, lengths, dh_lut, ds_lut):
+        """
+        Kernel compilado: sumas NN (ΔH, ΔS) y %GC para cada fila de la matriz
+        
+        Args:
+            enc_matrix: Matriz uint8 (n, Lmax) de bases codificadas (255 = no válida / relleno)
+            lengths: Longitud real de cada fila
+            dh_lut, ds_lut: Tablas NN indexadas por base1*4 + base2
+            
+        Returns:
+            Tupla de arreglos (ΔH, ΔS, %GC), NaN en filas inválidas
+        """
+        n = enc_matrix.shape[0]
+        dh = np.full(n, np.nan)
+        ds = np.full(n, np.nan)
+        gc = np.full(n, np.nan)
+        
+        for i in prange(n):
+            longitud = lengths[i]
+            if longitud < 2:
+                continue
+            
+            valida = True
+            dh_total = 0.0
+            ds_total = 0.0
+            gc_count = 0
+            for j in range(longitud):
+                base = enc_matrix[i, j]
+                if base == 255:
+                    valida = False
+                    break
+                if base == 1 or base == 2:
+                    gc_count += 1
+                if j > 0:
+                    idx = np.int64(enc_matrix[i, j - 1]) * 4 + np.int64(base)
+                    dh_total += dh_lut[idx]
+                    ds_total += ds_lut[idx]
+            if not valida:
+                continue
+            
+            dh[i] = dh_total
+            ds[i] = ds_total
+            gc[i] = gc_count / longitud * 100.0
+        
+        return dh, ds, gc
+
+
 class GeneradorSondas:
     """Generador de sondas para análisis de SNPs"""
     
@@ -286,7 +485,9 @@ class GeneradorSondas:
         Returns:
             Lista de resultados de sondas
         """
-        logger.debug(f"Generando sondas para ID: {seq_id}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Generando sondas para ID: {seq_id}")
         
         try:
             if longitudes is None:
@@ -310,56 +511,82 @@ class GeneradorSondas:
                 return []
             
             snp_pos_0 = snp_pos_int - 1  # Convertir a 0-indexed
-            alelo_ref = str(alelo_ref).upper().strip()
-            alelo_alt = str(alelo_alt).upper().strip()
+            alelo_ref = self.calculadora._limpiar_secuencia(alelo_ref)
+            alelo_alt = self.calculadora._limpiar_secuencia(alelo_alt)
             
-            logger.debug(f"Datos procesados - Secuencia: {len(secuencia)} bp, SNP pos: {snp_pos_int}, Alelos: {alelo_ref}->{alelo_alt}")
+            if debug:
+                logger.debug(f"Datos procesados - Secuencia: {len(secuencia)} bp, SNP pos: {snp_pos_int}, Alelos: {alelo_ref}->{alelo_alt}")
             
             # Verificar que el alelo de referencia coincida con la secuencia
             if secuencia[snp_pos_0] != alelo_ref:
                 logger.warning(f"Alelo de referencia no coincide para ID {seq_id}: esperado '{alelo_ref}', encontrado '{secuencia[snp_pos_0]}'")
                 # Continuar anyway, podría ser útil
             
-            resultados = []
-            
+            sondas = []
             for longitud in longitudes:
-                logger.debug(f"Evaluando longitud {longitud} para ID {seq_id}")
-                sondas = self._generar_sondas_longitud(
-                    secuencia, snp_pos_0, alelo_ref, alelo_alt, longitud
+                if debug:
+                    logger.debug(f"Evaluando longitud {longitud} para ID {seq_id}")
+                sondas.extend(
+                    (sonda_ref, sonda_alt, inicio, longitud)
+                    for sonda_ref, sonda_alt, inicio in self._generar_sondas_longitud(
+                        secuencia, snp_pos_0, alelo_ref, alelo_alt, longitud
+                    )
                 )
-                
-                for sonda_ref, sonda_alt, inicio in sondas:
-                    try:
-                        logger.debug(f"Calculando propiedades para sondas: ref='{sonda_ref}', alt='{sonda_alt}'")
-                        
-                        # Calcular propiedades para sonda de referencia
-                        props_ref = self.calculadora.calcular_propiedades_termodinamicas(sonda_ref)
-                        props_alt = self.calculadora.calcular_propiedades_termodinamicas(sonda_alt)
-                        
-                        resultado = SondaResult(
-                            id_seq=seq_id,
-                            sonda_ref=sonda_ref,
-                            sonda_alt=sonda_alt,
-                            longitud=longitud,
-                            inicio=inicio + 1,  # Convertir a 1-indexed
-                            snp_central=snp_pos_int,
-                            tm_ref=props_ref['tm'],
-                            tm_alt=props_alt['tm'],
-                            delta_tm=round(props_alt['tm'] - props_ref['tm'], 2),
-                            dh_ref=props_ref['dh'],
-                            dh_alt=props_alt['dh'],
-                            dg_ref_25=props_ref['dg_25'],
-                            dg_alt_25=props_alt['dg_25'],
-                            dg_ref_37=props_ref['dg_37'],
-                            dg_alt_37=props_alt['dg_37'],
-                            gc_content=props_ref['gc_content']  # GC content es igual para ambas sondas (solo cambia 1 nucleótido)
-                        )
-                        resultados.append(resultado)
-                        logger.debug(f"Sonda generada exitosamente: Tm_ref={props_ref['tm']}, Tm_alt={props_alt['tm']}, ΔG_ref(25°C)={props_ref['dg_25']}")
-                        
-                    except Exception as e:
-                        logger.error(f"Error calculando sonda {sonda_ref} para ID {seq_id}: {e}")
-                        continue
+            
+            # Las sondas ref del SNP se evalúan en un único lote como ventanas de la secuencia
+            # ya limpia y codificada; las alt difieren solo en la base del SNP, así que sus
+            # sumas NN se derivan de las de ref en O(1) por sonda
+            n = len(sondas)
+            inicios = np.fromiter((sonda[2] for sonda in sondas), dtype=np.int64, count=n)
+            longitud_sonda = np.fromiter((sonda[3] for sonda in sondas), dtype=np.int64, count=n)
+            dh_ref, ds_ref, gc_ref = self.calculadora._sumas_nn_ventanas(
+                self.calculadora._encode(secuencia), inicios, longitud_sonda
+            )
+            delta = self._delta_nn_sustitucion(secuencia, snp_pos_0, alelo_ref, alelo_alt)
+            if delta is not None:
+                dh_izq, ds_izq, dh_der, ds_der = delta
+                pos_relativa = snp_pos_0 - inicios
+                izq = pos_relativa > 0
+                der = pos_relativa < longitud_sonda - 1
+                dh_alt = dh_ref + np.where(izq, dh_izq, 0.0) + np.where(der, dh_der, 0.0)
+                ds_alt = ds_ref + np.where(izq, ds_izq, 0.0) + np.where(der, ds_der, 0.0)
+            else:
+                dh_alt, ds_alt, _ = self.calculadora._sumas_nn_lote([sonda[1] for sonda in sondas])
+            
+            props = self.calculadora._propiedades_desde_sumas(
+                np.concatenate((dh_ref, dh_alt)), np.concatenate((ds_ref, ds_alt))
+            )
+            # El lote devuelve NaN para sondas con bases no válidas
+            for i in np.flatnonzero(np.isnan(props['dh'][:n]) | np.isnan(props['dh'][n:])).tolist():
+                sonda_ref, sonda_alt, inicio, longitud = sondas[i]
+                logger.warning(f"Sonda inválida para ID {seq_id} (inicio={inicio + 1}, longitud={longitud}): ref='{sonda_ref}', alt='{sonda_alt}'")
+            
+            ref = {clave: valores[:n].tolist() for clave, valores in props.items()}
+            alt = {clave: valores[n:].tolist() for clave, valores in props.items()}
+            delta_tm = np.round(props['tm'][n:] - props['tm'][:n], 2).tolist()
+            gc_content = np.round(gc_ref, 2).tolist()
+            
+            resultados = [
+                SondaResult(
+                    id_seq=seq_id,
+                    sonda_ref=sonda_ref,
+                    sonda_alt=sonda_alt,
+                    longitud=longitud,
+                    inicio=inicio + 1,  # Convertir a 1-indexed
+                    snp_central=snp_pos_int,
+                    tm_ref=ref['tm'][i],
+                    tm_alt=alt['tm'][i],
+                    delta_tm=delta_tm[i],
+                    dh_ref=ref['dh'][i],
+                    dh_alt=alt['dh'][i],
+                    dg_ref_25=ref['dg_25'][i],
+                    dg_alt_25=alt['dg_25'][i],
+                    dg_ref_37=ref['dg_37'][i],
+                    dg_alt_37=alt['dg_37'][i],
+                    gc_content=gc_content[i]  # GC content es igual para ambas sondas (solo cambia 1 nucleótido)
+                )
+                for i, (sonda_ref, sonda_alt, inicio, longitud) in enumerate(sondas)
+            ]
             
             logger.info(f"Generadas {len(resultados)} sondas para ID: {seq_id}")
             return resultados
@@ -369,6 +596,33 @@ class GeneradorSondas:
             logger.error(traceback.format_exc())
             return []
     
+    def _delta_nn_sustitucion(self, secuencia: str, snp_pos: int,
+                              alelo_ref: str, alelo_alt: str) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Cambio en ΔH/ΔS de los dinucleótidos vecinos al SNP al sustituir alelo_ref por alelo_alt
+        
+        Returns:
+            Tupla (ΔH_izq, ΔS_izq, ΔH_der, ΔS_der), o None si la sustitución no es de una
+            sola base A/C/G/T y las sondas alt deben evaluarse completas
+        """
+        bases = 'ACGT'
+        if len(alelo_ref) != 1 or len(alelo_alt) != 1 or alelo_ref not in bases or alelo_alt not in bases:
+            return None
+        
+        nn = self.calculadora.NN_PARAMS
+        dh_izq = ds_izq = dh_der = ds_der = 0.0
+        # Un vecino no válido deja la sonda ref en NaN, que se propaga a la alt
+        if snp_pos > 0 and secuencia[snp_pos - 1] in bases:
+            vecino = secuencia[snp_pos - 1]
+            dh_izq = nn[vecino + alelo_alt][0] - nn[vecino + alelo_ref][0]
+            ds_izq = nn[vecino + alelo_alt][1] - nn[vecino + alelo_ref][1]
+        if snp_pos + 1 < len(secuencia) and secuencia[snp_pos + 1] in bases:
+            vecino = secuencia[snp_pos + 1]
+            dh_der = nn[alelo_alt + vecino][0] - nn[alelo_ref + vecino][0]
+            ds_der = nn[alelo_alt + vecino][1] - nn[alelo_ref + vecino][1]
+        
+        return dh_izq, ds_izq, dh_der, ds_der
+    
     def _generar_sondas_longitud(self, secuencia: str, snp_pos: int, 
                                 alelo_ref: str, alelo_alt: str, 
                                 longitud: int) -> List[Tuple[str, str, int]]:
@@ -377,26 +631,24 @@ class GeneradorSondas:
         half = longitud // 2
         inicio = max(snp_pos - half, 0)
         fin = min(inicio + longitud, len(secuencia))
+        debug = logger.isEnabledFor(logging.DEBUG)
         
-        logger.debug(f"Generando sonda longitud {longitud}: inicio={inicio}, fin={fin}, SNP={snp_pos}")
-        
-        if fin - inicio == longitud and snp_pos in range(inicio, fin):
+        if fin - inicio == longitud and inicio <= snp_pos < fin:
             sonda_ref = secuencia[inicio:fin]
             pos_relativa = snp_pos - inicio
             
-            logger.debug(f"Sonda base: '{sonda_ref}', posición relativa SNP: {pos_relativa}")
-            
             # Verificar que el alelo de referencia coincida (más permisivo)
             if pos_relativa < len(sonda_ref) and sonda_ref[pos_relativa] == alelo_ref:
                 sonda_alt = (sonda_ref[:pos_relativa] + 
                            alelo_alt + 
                            sonda_ref[pos_relativa + 1:])
                 sondas.append((sonda_ref, sonda_alt, inicio))
-                logger.debug(f"Sonda válida generada: ref='{sonda_ref}', alt='{sonda_alt}'")
-            else:
+                if debug:
+                    logger.debug(f"Sonda válida generada (inicio={inicio}, posición relativa SNP={pos_relativa}): ref='{sonda_ref}', alt='{sonda_alt}'")
+            elif debug:
                 logger.debug(f"Alelo no coincide en posición {pos_relativa}: esperado '{alelo_ref}', encontrado '{sonda_ref[pos_relativa] if pos_relativa < len(sonda_ref) else 'N/A'}'")
-        else:
-            logger.debug(f"Sonda no válida: longitud calculada={fin-inicio}, requerida={longitud}, SNP en rango={snp_pos in range(inicio, fin)}")
+        elif debug:
+            logger.debug(f"Sonda no válida: longitud calculada={fin-inicio}, requerida={longitud}")
         
         return sondas
 
@@ -405,9 +657,19 @@ class ProcesadorExcel:
     """Procesador de archivos Excel con datos de SNPs"""
     
     COLUMNAS_REQUERIDAS = ["ID", "Secuencia", "Coordenada SNP", "Alelo_Ref", "Alelo_Alt"]
+    COLUMNAS_TEXTO = ["ID", "Secuencia", "Alelo_Ref", "Alelo_Alt"]
+    MIN_FILAS_PARALELO = 5000  # Filas mínimas por proceso para compensar el arranque (spawn) de cada trabajador
     
-    def __init__(self, generador_sondas: GeneradorSondas):
+    def __init__(self, generador_sondas: GeneradorSondas, n_procesos: Optional[int] = None):
+        """
+        Inicializa el procesador
+        
+        Args:
+            generador_sondas: Generador usado para cada fila
+            n_procesos: Procesos para el procesamiento paralelo (default: os.cpu_count())
+        """
         self.generador_sondas = generador_sondas
+        self.n_procesos = n_procesos
         logger.debug("ProcesadorExcel inicializado")
     
     def procesar_archivo(self, excel_path: str) -> pd.DataFrame:
@@ -422,37 +684,31 @@ class ProcesadorExcel:
         """
         try:
             logger.info(f"Leyendo archivo Excel: {excel_path}")
-            df = pd.read_excel(excel_path)
-            logger.info(f"Archivo leído exitosamente. Filas: {len(df)}, Columnas: {list(df.columns)}")
+            # Solo se leen las columnas requeridas; las de texto sin inferencia de tipos.
+            # El filtro anota cada encabezado visto para reportar todas las columnas del archivo
+            vistas = []
+            df = pd.read_excel(
+                excel_path,
+                usecols=lambda columna: vistas.append(columna) or columna in self.COLUMNAS_REQUERIDAS,
+                dtype={columna: str for columna in self.COLUMNAS_TEXTO}
+            )
+            columnas = list(dict.fromkeys(vistas))
+            logger.info(f"Archivo leído exitosamente. Filas: {len(df)}, Columnas: {columnas}")
             
-            self._validar_columnas(df)
+            self._validar_columnas(columnas)
             
             # Mostrar muestra de datos para debugging
-            logger.debug("Primeras 3 filas del archivo:")
-            for idx, fila in df.head(3).iterrows():
-                logger.debug(f"Fila {idx}: {dict(fila)}")
-            
-            todos_resultados = []
-            filas_procesadas = 0
-            filas_con_error = 0
-            
-            for idx, fila in df.iterrows():
-                try:
-                    logger.debug(f"Procesando fila {idx + 1}/{len(df)}")
-                    resultados_fila = self._procesar_fila(fila)
-                    todos_resultados.extend(resultados_fila)
-                    filas_procesadas += 1
-                    
-                    if resultados_fila:
-                        logger.debug(f"Fila {idx + 1}: {len(resultados_fila)} sondas generadas")
-                    else:
-                        logger.warning(f"Fila {idx + 1}: No se generaron sondas")
-                        
-                except Exception as e:
-                    filas_con_error += 1
-                    logger.error(f"Error procesando fila {idx + 1}: {e}")
-                    logger.error(f"Datos de la fila: {dict(fila)}")
-                    continue
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Primeras 3 filas del archivo:")
+                for idx, fila in df.head(3).iterrows():
+                    logger.debug(f"Fila {idx}: {dict(fila)}")
+            
+            # Extraer columnas como arreglos una sola vez evita crear una Series por fila
+            columnas = [df[columna].to_numpy() for columna in self.COLUMNAS_REQUERIDAS]
+            filas = [(idx, dict(zip(self.COLUMNAS_REQUERIDAS, valores)))
+                     for idx, valores in enumerate(zip(*columnas))]
+            
+            todos_resultados, filas_procesadas, filas_con_error = self._procesar_en_paralelo(filas)
             
             logger.info(f"Procesamiento completado: {filas_procesadas} filas procesadas, {filas_con_error} errores, {len(todos_resultados)} sondas totales")
             
@@ -467,17 +723,85 @@ class ProcesadorExcel:
             logger.error(traceback.format_exc())
             raise
     
-    def _validar_columnas(self, df: pd.DataFrame):
-        """Valida que el DataFrame tenga las columnas requeridas"""
-        columnas_faltantes = set(self.COLUMNAS_REQUERIDAS) - set(df.columns)
+    def _procesar_en_paralelo(self, filas: List[Tuple[int, Dict]]) -> Tuple[List[SondaResult], int, int]:
+        """
+        Reparte las filas en bloques y los procesa en paralelo con un ProcessPoolExecutor
+        
+        Con pocas filas (menos de MIN_FILAS_PARALELO) o un solo proceso disponible,
+        las filas se procesan secuencialmente en el proceso actual.
+        
+        Returns:
+            Tupla con (resultados en el orden de las filas, filas procesadas, filas con error)
+        """
+        n_procesos = min(self.n_procesos or os.cpu_count() or 1, max(len(filas) // self.MIN_FILAS_PARALELO, 1))
+        if n_procesos <= 1:
+            return self._procesar_filas(filas, len(filas))
+        
+        tamano_bloque = -(-len(filas) // n_procesos)
+        bloques = [filas[i:i + tamano_bloque] for i in range(0, len(filas), tamano_bloque)]
+        logger.info(f"Procesando {len(filas)} filas en {len(bloques)} procesos")
+        
+        try:
+            # 'spawn' en todas las plataformas: fork no es seguro tras inicializar los hilos de Numba
+            contexto = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=n_procesos, mp_context=contexto) as executor:
+                parciales = list(executor.map(
+                    _procesar_chunk, bloques, repeat(self.generador_sondas), repeat(len(filas))
+                ))
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"No se pudo procesar en paralelo ({e}); se procesará secuencialmente")
+            return self._procesar_filas(filas, len(filas))
+        
+        todos_resultados = [resultado for resultados, _, _ in parciales for resultado in resultados]
+        return (todos_resultados,
+                sum(procesadas for _, procesadas, _ in parciales),
+                sum(con_error for _, _, con_error in parciales))
+    
+    def _procesar_filas(self, filas: List[Tuple[int, Dict]], total_filas: int) -> Tuple[List[SondaResult], int, int]:
+        """
+        Procesa secuencialmente una lista de filas (índice, diccionario columna -> valor)
+        
+        Returns:
+            Tupla con (resultados, filas procesadas, filas con error)
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        todos_resultados = []
+        filas_procesadas = 0
+        filas_con_error = 0
+        
+        for idx, fila in filas:
+            try:
+                if debug:
+                    logger.debug(f"Procesando fila {idx + 1}/{total_filas}")
+                resultados_fila = self._procesar_fila(fila)
+                todos_resultados.extend(resultados_fila)
+                filas_procesadas += 1
+                
+                if resultados_fila:
+                    if debug:
+                        logger.debug(f"Fila {idx + 1}: {len(resultados_fila)} sondas generadas")
+                else:
+                    logger.warning(f"Fila {idx + 1}: No se generaron sondas")
+                    
+            except Exception as e:
+                filas_con_error += 1
+                logger.error(f"Error procesando fila {idx + 1}: {e}")
+                logger.error(f"Datos de la fila: {fila}")
+                continue
+        
+        return todos_resultados, filas_procesadas, filas_con_error
+    
+    def _validar_columnas(self, columnas: List[str]):
+        """Valida que el encabezado del archivo tenga las columnas requeridas"""
+        columnas_faltantes = set(self.COLUMNAS_REQUERIDAS) - set(columnas)
         if columnas_faltantes:
-            error_msg = f"Columnas faltantes: {columnas_faltantes}. Columnas disponibles: {list(df.columns)}"
+            error_msg = f"Columnas faltantes: {columnas_faltantes}. Columnas disponibles: {columnas}"
             logger.error(error_msg)
             raise ValueError(error_msg)
         logger.debug("Validación de columnas exitosa")
     
     def _procesar_fila(self, fila) -> List[SondaResult]:
-        """Procesa una fila individual del DataFrame"""
+        """Procesa una fila individual del DataFrame (diccionario columna -> valor)"""
         try:
             # Extraer datos con manejo de valores NaN
             seq_id = str(fila["ID"]) if not pd.isna(fila["ID"]) else f"seq_{hash(str(fila))}"
@@ -486,7 +810,8 @@ class ProcesadorExcel:
             alelo_ref = str(fila["Alelo_Ref"]) if not pd.isna(fila["Alelo_Ref"]) else ""
             alelo_alt = str(fila["Alelo_Alt"]) if not pd.isna(fila["Alelo_Alt"]) else ""
             
-            logger.debug(f"Procesando: ID={seq_id}, Secuencia={len(secuencia)} bp, SNP={snp_pos}, Alelos={alelo_ref}->{alelo_alt}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Procesando: ID={seq_id}, Secuencia={len(secuencia)} bp, SNP={snp_pos}, Alelos={alelo_ref}->{alelo_alt}")
             
             return self.generador_sondas.generar_sondas_snp(
                 secuencia=secuencia,
@@ -507,36 +832,66 @@ class ProcesadorExcel:
         
         logger.info(f"Convirtiendo {len(resultados)} resultados a DataFrame")
         
-        df_resultado = pd.DataFrame([
-            {
-                "ID": r.id_seq,
-                "Sonda_ref": r.sonda_ref,
-                "Sonda_alt": r.sonda_alt,
-                "Longitud": r.longitud,
-                "Inicio": r.inicio,
-                "SNP Central": r.snp_central,
-                "Tm_ref (°C)": r.tm_ref,
-                "Tm_alt (°C)": r.tm_alt,
-                "ΔTm (°C)": r.delta_tm,
-                "ΔH_ref (kcal/mol)": r.dh_ref,
-                "ΔH_alt (kcal/mol)": r.dh_alt,
-                "ΔG_ref_25°C (kcal/mol)": r.dg_ref_25,
-                "ΔG_alt_25°C (kcal/mol)": r.dg_alt_25,
-                "ΔG_ref_37°C (kcal/mol)": r.dg_ref_37,
-                "ΔG_alt_37°C (kcal/mol)": r.dg_alt_37,
-                "ΔΔG_25°C (kcal/mol)": round(r.dg_alt_25 - r.dg_ref_25, 2),
-                "ΔΔG_37°C (kcal/mol)": round(r.dg_alt_37 - r.dg_ref_37, 2),
-                "GC_content (%)": r.gc_content,
-                "Estabilidad_25°C": "Estable" if r.dg_ref_25 < 0 else "Inestable",
-                "Estabilidad_37°C": "Estable" if r.dg_ref_37 < 0 else "Inestable"
-            }
-            for r in resultados
-        ])
+        n = len(resultados)
+        
+        def columna(atributo: str, dtype=np.float64) -> np.ndarray:
+            return np.fromiter((getattr(r, atributo) for r in resultados), dtype=dtype, count=n)
+        
+        dg_ref_25 = columna('dg_ref_25')
+        dg_alt_25 = columna('dg_alt_25')
+        dg_ref_37 = columna('dg_ref_37')
+        dg_alt_37 = columna('dg_alt_37')
+        
+        # Una asignación por columna con dtype conocido en lugar de un dict por fila
+        df_resultado = pd.DataFrame({
+            "ID": [r.id_seq for r in resultados],
+            "Sonda_ref": [r.sonda_ref for r in resultados],
+            "Sonda_alt": [r.sonda_alt for r in resultados],
+            "Longitud": columna('longitud', np.int64),
+            "Inicio": columna('inicio', np.int64),
+            "SNP Central": columna('snp_central', np.int64),
+            "Tm_ref (°C)": columna('tm_ref'),
+            "Tm_alt (°C)": columna('tm_alt'),
+            "ΔTm (°C)": columna('delta_tm'),
+            "ΔH_ref (kcal/mol)": columna('dh_ref'),
+            "ΔH_alt (kcal/mol)": columna('dh_alt'),
+            "ΔG_ref_25°C (kcal/mol)": dg_ref_25,
+            "ΔG_alt_25°C (kcal/mol)": dg_alt_25,
+            "ΔG_ref_37°C (kcal/mol)": dg_ref_37,
+            "ΔG_alt_37°C (kcal/mol)": dg_alt_37,
+            "ΔΔG_25°C (kcal/mol)": np.round(dg_alt_25 - dg_ref_25, 2),
+            "ΔΔG_37°C (kcal/mol)": np.round(dg_alt_37 - dg_ref_37, 2),
+            "GC_content (%)": columna('gc_content'),
+            "Estabilidad_25°C": np.where(dg_ref_25 < 0, "Estable", "Inestable").tolist(),
+            "Estabilidad_37°C": np.where(dg_ref_37 < 0, "Estable", "Inestable").tolist()
+        })
         
         logger.info(f"DataFrame creado exitosamente: {len(df_resultado)} filas")
         return df_resultado
 
 
+def _procesar_chunk(filas: List[Tuple[int, Dict]], generador_sondas: GeneradorSondas,
+                    total_filas: int) -> Tuple[List[SondaResult], int, int]:
+    """Procesa un bloque de filas en un proceso trabajador (función de módulo, serializable)"""
+    if NUMBA_DISPONIBLE:
+        # El paralelismo ya lo aportan los procesos; evita sobresuscribir hilos de Numba
+        set_num_threads(1)
+    return ProcesadorExcel(generador_sondas)._procesar_filas(filas, total_filas)
+
+
+# Raíz Tk oculta compartida por todos los diálogos (se crea al primer uso)
+_TK_ROOT: Optional[tk.Tk] = None
+
+
+def _get_root() -> tk.Tk:
+    """Devuelve la raíz Tk oculta, creándola una sola vez"""
+    global _TK_ROOT
+    if _TK_ROOT is None:
+        _TK_ROOT = tk.Tk()
+        _TK_ROOT.withdraw()
+    return _TK_ROOT
+
+
 class InterfazUsuario:
     """Interfaz gráfica para selección de archivos"""
     
@@ -549,15 +904,12 @@ class InterfazUsuario:
             Ruta del archivo seleccionado o None
         """
         try:
-            root = tk.Tk()
-            root.withdraw()
-            
             archivo = filedialog.askopenfilename(
+                parent=_get_root(),
                 title="Selecciona archivo Excel con datos de SNPs",
                 filetypes=[("Excel files", "*.xlsx"), ("Excel files", "*.xls"), ("All files", "*.*")]
             )
             
-            root.destroy()
             return archivo if archivo else None
         except Exception as e:
             logger.error(f"Error en selección de archivo: {e}")
@@ -567,22 +919,68 @@ class InterfazUsuario:
     def mostrar_mensaje(titulo: str, mensaje: str, tipo: str = "info"):
         """Muestra mensaje al usuario"""
         try:
-            root = tk.Tk()
-            root.withdraw()
+            root = _get_root()
             
             if tipo == "error":
-                messagebox.showerror(titulo, mensaje)
+                messagebox.showerror(titulo, mensaje, parent=root)
             elif tipo == "warning":
-                messagebox.showwarning(titulo, mensaje)
+                messagebox.showwarning(titulo, mensaje, parent=root)
             else:
-                messagebox.showinfo(titulo, mensaje)
-            
-            root.destroy()
+                messagebox.showinfo(titulo, mensaje, parent=root)
         except Exception as e:
             logger.error(f"Error mostrando mensaje: {e}")
             print(f"{titulo}: {mensaje}")
 
 
+# Por encima de este número de filas los resultados se guardan en Parquet en lugar de Excel
+LIMITE_FILAS_EXCEL = 500_000
+# Filas por hoja que admite Excel (incluida la fila de encabezado)
+MAX_FILAS_HOJA_EXCEL = 1_048_576
+
+
+def guardar_resultados(df: pd.DataFrame, archivo_salida: str) -> str:
+    """
+    Guarda los resultados en Excel, o en Parquet si superan LIMITE_FILAS_EXCEL filas
+    
+    Con xlsxwriter disponible, el Excel se escribe fila a fila en modo
+    constant_memory (memoria constante por fila en lugar de todo el libro).
+    
+    Args:
+        df: DataFrame con resultados
+        archivo_salida: Ruta del archivo .xlsx de salida
+        
+    Returns:
+        Ruta del archivo efectivamente escrito
+    """
+    if len(df) > LIMITE_FILAS_EXCEL:
+        archivo_parquet = str(Path(archivo_salida).with_suffix('.parquet'))
+        try:
+            df.to_parquet(archivo_parquet, index=False)
+            return archivo_parquet
+        except ImportError as e:
+            logger.warning(f"No se pudo guardar en Parquet ({e}); se guardará en Excel")
+    
+    # xlsxwriter descarta sin error las filas que exceden la hoja; se rechaza antes de escribir
+    if len(df) >= MAX_FILAS_HOJA_EXCEL:
+        raise ValueError(f"Demasiadas sondas para una hoja de Excel: {len(df)} filas "
+                         f"(máximo {MAX_FILAS_HOJA_EXCEL - 1}); instale pyarrow para guardar en Parquet")
+    
+    if not XLSXWRITER_DISPONIBLE:
+        df.to_excel(archivo_salida, index=False)
+        return archivo_salida
+    
+    # pandas escribe por columnas, incompatible con constant_memory; se escriben filas directamente
+    workbook = xlsxwriter.Workbook(archivo_salida, {'constant_memory': True, 'strings_to_numbers': False})
+    try:
+        hoja = workbook.add_worksheet()
+        hoja.write_row(0, 0, df.columns)
+        for fila, valores in enumerate(df.itertuples(index=False, name=None), start=1):
+            hoja.write_row(fila, 0, [None if pd.isna(valor) else valor for valor in valores])
+    finally:
+        workbook.close()
+    return archivo_salida
+
+
 def generar_resumen_estadistico(df: pd.DataFrame) -> str:
     """Genera un resumen estadístico de los resultados"""
     if df.empty:
@@ -593,30 +991,39 @@ def generar_resumen_estadistico(df: pd.DataFrame) -> str:
     resumen.append("=" * 40)
     resumen.append(f"Total de sondas generadas: {len(df)}")
     
+    # Media y desviación estándar de todas las columnas numéricas en una sola agregación
+    stats = df[[
+        'Tm_ref (°C)', 'Tm_alt (°C)', 'ΔTm (°C)',
+        'ΔG_ref_25°C (kcal/mol)', 'ΔG_ref_37°C (kcal/mol)',
+        'ΔΔG_25°C (kcal/mol)', 'ΔΔG_37°C (kcal/mol)', 'GC_content (%)'
+    ]].agg(['mean', 'std'])
+    media, desv = stats.loc['mean'], stats.loc['std']
+    gc_min, gc_max = df['GC_content (%)'].agg(['min', 'max'])
+    
     # Estadísticas de Tm
     resumen.append(f"\n🌡️ TEMPERATURA DE MELTING:")
-    resumen.append(f"  Tm promedio (ref): {df['Tm_ref (°C)'].mean():.1f} ± {df['Tm_ref (°C)'].std():.1f} °C")
-    resumen.append(f"  Tm promedio (alt): {df['Tm_alt (°C)'].mean():.1f} ± {df['Tm_alt (°C)'].std():.1f} °C")
-    resumen.append(f"  ΔTm promedio: {df['ΔTm (°C)'].mean():.1f} ± {df['ΔTm (°C)'].std():.1f} °C")
+    resumen.append(f"  Tm promedio (ref): {media['Tm_ref (°C)']:.1f} ± {desv['Tm_ref (°C)']:.1f} °C")
+    resumen.append(f"  Tm promedio (alt): {media['Tm_alt (°C)']:.1f} ± {desv['Tm_alt (°C)']:.1f} °C")
+    resumen.append(f"  ΔTm promedio: {media['ΔTm (°C)']:.1f} ± {desv['ΔTm (°C)']:.1f} °C")
     
     # Estadísticas de ΔG
     resumen.append(f"\n⚡ ENERGÍA LIBRE (ΔG):")
-    resumen.append(f"  ΔG promedio a 25°C: {df['ΔG_ref_25°C (kcal/mol)'].mean():.2f} ± {df['ΔG_ref_25°C (kcal/mol)'].std():.2f} kcal/mol")
-    resumen.append(f"  ΔG promedio a 37°C: {df['ΔG_ref_37°C (kcal/mol)'].mean():.2f} ± {df['ΔG_ref_37°C (kcal/mol)'].std():.2f} kcal/mol")
-    resumen.append(f"  ΔΔG promedio a 25°C: {df['ΔΔG_25°C (kcal/mol)'].mean():.2f} ± {df['ΔΔG_25°C (kcal/mol)'].std():.2f} kcal/mol")
-    resumen.append(f"  ΔΔG promedio a 37°C: {df['ΔΔG_37°C (kcal/mol)'].mean():.2f} ± {df['ΔΔG_37°C (kcal/mol)'].std():.2f} kcal/mol")
+    resumen.append(f"  ΔG promedio a 25°C: {media['ΔG_ref_25°C (kcal/mol)']:.2f} ± {desv['ΔG_ref_25°C (kcal/mol)']:.2f} kcal/mol")
+    resumen.append(f"  ΔG promedio a 37°C: {media['ΔG_ref_37°C (kcal/mol)']:.2f} ± {desv['ΔG_ref_37°C (kcal/mol)']:.2f} kcal/mol")
+    resumen.append(f"  ΔΔG promedio a 25°C: {media['ΔΔG_25°C (kcal/mol)']:.2f} ± {desv['ΔΔG_25°C (kcal/mol)']:.2f} kcal/mol")
+    resumen.append(f"  ΔΔG promedio a 37°C: {media['ΔΔG_37°C (kcal/mol)']:.2f} ± {desv['ΔΔG_37°C (kcal/mol)']:.2f} kcal/mol")
     
     # Estabilidad
-    estables_25 = len(df[df['Estabilidad_25°C'] == 'Estable'])
-    estables_37 = len(df[df['Estabilidad_37°C'] == 'Estable'])
+    estables_25 = int(df['Estabilidad_25°C'].eq('Estable').sum())
+    estables_37 = int(df['Estabilidad_37°C'].eq('Estable').sum())
     resumen.append(f"\n🔬 ESTABILIDAD:")
     resumen.append(f"  Sondas estables a 25°C: {estables_25}/{len(df)} ({estables_25/len(df)*100:.1f}%)")
     resumen.append(f"  Sondas estables a 37°C: {estables_37}/{len(df)} ({estables_37/len(df)*100:.1f}%)")
     
     # Contenido GC
     resumen.append(f"\n🧬 CONTENIDO GC:")
-    resumen.append(f"  GC promedio: {df['GC_content (%)'].mean():.1f} ± {df['GC_content (%)'].std():.1f}%")
-    resumen.append(f"  Rango GC: {df['GC_content (%)'].min():.1f}% - {df['GC_content (%)'].max():.1f}%")
+    resumen.append(f"  GC promedio: {media['GC_content (%)']:.1f} ± {desv['GC_content (%)']:.1f}%")
+    resumen.append(f"  Rango GC: {gc_min:.1f}% - {gc_max:.1f}%")
     
     # Longitudes
     resumen.append(f"\n📏 LONGITUDES:")
@@ -660,7 +1067,11 @@ def main():
         df_resultado = procesador.procesar_archivo(archivo_excel)
         
         if df_resultado.empty:
-            mensaje_warning = "No se generaron resultados válidos. Revisa el archivo de log para más detalles."
+            mensaje_warning = (
+                "No se generaron resultados válidos. "
+                + (f"Revisa el archivo {ARCHIVO_LOG} para más detalles." if MODO_DEBUG
+                   else "Ejecuta con CIENBIO_DEBUG=1 para obtener un log detallado.")
+            )
             logger.warning(mensaje_warning)
             print(f"⚠️ {mensaje_warning}")
             InterfazUsuario.mostrar_mensaje("Advertencia", mensaje_warning, "warning")
@@ -670,7 +1081,7 @@ def main():
         archivo_salida = str(Path(archivo_excel).with_suffix('')) + "_evaluado.xlsx"
         logger.info(f"Guardando resultados en: {archivo_salida}")
         
-        df_resultado.to_excel(archivo_salida, index=False)
+        archivo_salida = guardar_resultados(df_resultado, archivo_salida)
         
         # Generar resumen estadístico
         resumen = generar_resumen_estadistico(df_resultado)
@@ -682,12 +1093,13 @@ def main():
             f.write(resumen)
         
         # Mensaje de éxito
+        linea_log = f"📝 Log detallado: {ARCHIVO_LOG}\n" if MODO_DEBUG else ""
         mensaje_exito = (
             f"✅ Evaluación completada exitosamente!\n\n"
             f"📊 Sondas generadas: {len(df_resultado)}\n"
-            f"💾 Archivo Excel: {Path(archivo_salida).name}\n"
+            f"💾 Archivo de resultados: {Path(archivo_salida).name}\n"
             f"📄 Resumen estadístico: {Path(archivo_resumen).name}\n"
-            f"📝 Log detallado: cienbio_debug.log\n\n"
+            f"{linea_log}\n"
             f"🔬 Propiedades calculadas:\n"
             f"  • Temperatura de melting (Tm)\n"
             f"  • Entalpía (ΔH)\n"